@@ -7,6 +7,7 @@
 # Requirements: pyRevit add-in
 
 from pyrevit import forms, revit, DB
+from System.Collections.Generic import List
 
 # Get the current Revit document
 doc = revit.doc
@@ -25,23 +26,40 @@ purge = forms.alert(
 if purge:
     # Initialize a list to store the names of deleted images
     deleted_images = []
-    # Start a transaction
-    with revit.Transaction('Purge all images'):
-
-        # Collect all ImageType elements in the document
-        image_types = DB.FilteredElementCollector(doc).OfClass(DB.ImageType).ToElements()
-
-        # Iterate over each ImageType and remove it
-        for image_type in image_types:
-            
-            # Get the name of the image file from the Element class
-            image_name = image_type.get_Parameter(DB.BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
-            # Store the name of the image file
-            deleted_images.append(image_name)
-
-            doc.Delete(image_type.Id)
-
-    # Print the list of deleted images
-    print("Following files were deleted:\n")
-    for image_name in deleted_images:
-        print(image_name + "\n")
+
+    # Collect all ImageType elements in the document
+    image_types = DB.FilteredElementCollector(doc).OfClass(DB.ImageType).ToElements()
+
+    # Get the image file names before the transaction opens - parameter reads
+    # inside an open transaction pay extra change-tracking cost.
+    names_and_ids = [(image_type.get_Parameter(DB.BuiltInParameter.SYMBOL_NAME_PARAM).AsString(),
+                      image_type.Id)
+                     for image_type in image_types]
+
+    # Delete throws on an empty collection, so skip the transaction entirely
+    # when the model holds no images
+    if names_and_ids:
+        ids = List[DB.ElementId]([image_type_id for _, image_type_id in names_and_ids])
+
+        # Start a transaction
+        with revit.Transaction('Purge all images'):
+            try:
+                # One Delete call removes every ImageType in a single pass
+                doc.Delete(ids)
+                deleted_images = [image_name for image_name, _ in names_and_ids]
+            except Exception:
+                # Falls back to per-image deletes so one bad id
+                # does not abort the whole purge.
+                for image_name, image_type_id in names_and_ids:
+                    try:
+                        doc.Delete(image_type_id)
+                        deleted_images.append(image_name)
+                    except Exception as del_err:
+                        print('Image: {} could not be deleted\nError: {}'.format(image_name, del_err))
+
+        # Print the list of deleted images
+        print("Following files were deleted:\n")
+        for image_name in deleted_images:
+            print(image_name + "\n")
+    else:
+        forms.alert('No images found in the model.')
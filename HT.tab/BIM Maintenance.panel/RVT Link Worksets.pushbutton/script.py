@@ -9,6 +9,7 @@
 # Since 1.0.1 Workset Name and Mark Added. Error in startswith() corrected. Link prefix added as variable.
 # Since 1.0.2 Zone query added.
 
+import bisect
 import re
 # from sys import exit # to use exit() to terminate the script
 # Import pyRevit modules
@@ -17,11 +18,15 @@ from pyrevit import revit, DB, script, forms
 # Get the current document
 doc = revit.doc
 enable_worksharing = False
-# Collects all Revit links in the project
-revit_links = DB.FilteredElementCollector(doc).OfClass(DB.RevitLinkInstance).ToElements()
+# Collects all Revit links in the project. Iterating the collector directly
+# avoids materializing every element up front with ToElements(); the name
+# and type id are read once here and reused by the main loop.
+link_records = []
+for link in DB.FilteredElementCollector(doc).OfClass(DB.RevitLinkInstance):
+    link_records.append((link, link.Name.partition(".rvt")[0], link.GetTypeId()))
 
-# if there are no links there is no point to continue 
-if not revit_links:
+# if there are no links there is no point to continue
+if not link_records:
     # https://docs.pyrevitlabs.io/reference/pyrevit/forms/#pyrevit.forms.alert
     forms.alert('No Revit links found in the project.', title="Workset Info", exitscript=True)
 
@@ -39,136 +44,194 @@ if not doc.IsWorkshared and doc.CanEnableWorksharing:
 elif not doc.IsWorkshared and not doc.CanEnableWorksharing:
     forms.alert("This is not a worksahred project and it is not possible to enable worksharing.", title="Worksharing not possible", exitscript=True)
 
+workset_by_id = {}
 if not enable_worksharing:
     # Create a FilteredWorksetCollector to get all Worksets in the document
     worksets_collection = DB.FilteredWorksetCollector(doc).OfKind(DB.WorksetKind.UserWorkset)
-    # Create a dictionary with workset names as keys and worksets as values
-    workset_dict = {workset.Name: workset for workset in worksets_collection}
+    # Index the worksets by name and by id in one pass over the collector.
+    # The main loop resolves link worksets against the id map instead of
+    # calling WorksetTable.GetWorkset per link.
+    workset_dict = {}
+    default_workset_id = None
+    for workset in worksets_collection:
+        workset_dict[workset.Name] = workset
+        workset_by_id[workset.Id.IntegerValue] = workset
+        # Remembered here so the deletion block at the end does not need
+        # to rescan all worksets for the default one
+        if workset.IsDefaultWorkset:
+            default_workset_id = workset.Id
 
-all_rvt_link_names = []
-new_workset_names = []
-used_workset_names = []
+# Sets - the unused-workset discovery below only tests membership
+new_workset_names = set()
+used_workset_names = set()
 linked_file_prefix = 'Z-Linked RVT-'
 
-for link in revit_links:
-    link_name = link.Name.split(".rvt")[0]
-    all_rvt_link_names.append(link_name)
-count = 0
-# Query to add Originator to the workset link name
-add_originator = forms.alert(
-                'Include HTL in the workset name?\n\nTypical workset name for a an architectural link starts with Z-Linked RVT A-... followed by the originator code i.e. HTL.\n\nPress "Yes" if models of other architectural companies will be linked to this model.', 
-                title="Include HTL?",
-                cancel=True,
-                ok = False,
-                yes = True,
-                no = True
-            )
-# Query to add Zone to the workset link name
-add_zone = forms.alert(
-                'Include Zone code in the workset name?\n\nPress "Yes" if model is split into multiple zones combined together.', 
-                title="Include Zones?",
-                cancel=True,
-                ok = False,
-                yes = True,
-                no = True
-            )
-for link in revit_links:
-    count += 1
-    link_name = link.Name.split(".rvt")[0]
-    link_workset = doc.GetWorksetTable().GetWorkset(link.WorksetId)
-    link_type_id = link.GetTypeId()
-    link_type = doc.GetElement(link_type_id)
-    link_type_workset = doc.GetWorksetTable().GetWorkset(link_type.WorksetId)
-    
+# Bound once - the apply pass reads these for every link
+PARTITION_PARAM = DB.BuiltInParameter.ELEM_PARTITION_PARAM # the Workset parameter
+LINK_NAME_PARAM = DB.BuiltInParameter.RVT_LINK_INSTANCE_NAME
+MARK_PARAM = DB.BuiltInParameter.ALL_MODEL_MARK
+
+# Only the zone (third part) of the file name is needed
+file_zone_pattern = re.compile(r"\w+-\w+-(\w+)")
+
+def parse_link_name(name):
+    # Link names are plain dash-separated tokens,
+    # i.e. GSK-HTL-RE-ZZ-M3-A-0001 Description
+    # Part 1: Project (e.g., "GSK")
+    # Part 2: Originator (e.g., "HTL")
+    # Part 3: Zone (e.g., "RE")
+    # Part 4: Level (e.g., "ZZ")
+    # Part 5: Type (e.g., "M3")
+    # Part 6: Discipline (e.g., "A")
+    # Part 7: Digits (e.g., "0001") followed by an optional description
+    # A split covers this without the regex engine or match-object
+    # allocation. Returns (originator, zone, discipline, digits,
+    # description), or None for names outside the naming standard.
+    parts = name.split('-')
+    if len(parts) < 7 or not all(parts[:6]):
+        return None
+    tail = parts[6]
+    i = 0
+    while i < len(tail) and tail[i].isdigit():
+        i += 1
+    if i == 0:
+        return None
+    return parts[1], parts[2], parts[5], tail[:i], tail[i:]
+
+def base_name_of(name):
+    # Strips the trailing digits and the optional description, so links
+    # pointing at parts of the same model end up with the same base name.
+    # Returns None for names outside the naming standard.
+    parsed = parse_link_name(name)
+    if parsed is None:
+        return None
+    digits = parsed[3]
+    description = parsed[4]
+    if description:
+        base_name = name.replace(description, "").strip()
+        base_name = base_name.replace(digits, "").strip()
+    else:
+        base_name = name.replace(digits, "").strip()
+    return base_name
+
+def find_similar_part_names(desc, part_number, base_name, last_digit, similar_link_names):
+    # Pure function of its arguments - defined once here instead of being
+    # rebuilt as a nested function on every iteration of the link loop.
+    if int(last_digit) > 1: # then we need to add number to the end anyway
+        if desc != "":
+            desc = desc + " " + last_digit
+        else:
+            desc = last_digit
+    else: # if 1 at the end we need to find if there are more
+    # find if there are two or more Internal model files.
+    # similar_link_names comes out of prefix_matches already
+    # sorted, so the same binary search works on it too.
+        similar_part_names = prefix_matches(similar_link_names, base_name + part_number)
+        if len(similar_part_names) > 0: # then there are many parts. We need to add additional number.
+            if desc != "":
+                desc = desc + " " + last_digit
+            else:
+                desc = last_digit
+    return desc
+
+def prefix_matches(sorted_names, prefix):
+    # All names sharing a prefix sit together in a sorted list; bisect jumps
+    # to the first candidate and the walk stops at the first non-match.
+    i = bisect.bisect_left(sorted_names, prefix)
+    matches = []
+    while i < len(sorted_names) and sorted_names[i].startswith(prefix):
+        matches.append(sorted_names[i])
+        i += 1
+    return matches
+
+all_rvt_link_names = [link_name for _, link_name, _ in link_records]
+# Single query to add Originator and/or Zone to the workset link names
+# instead of two separate yes/no dialogs.
+# Typical workset name for an architectural link starts with Z-Linked RVT A-...
+# followed by the originator code i.e. HTL. Include HTL if models of other
+# architectural companies will be linked to this model. Include the Zone code
+# if the model is split into multiple zones combined together.
+name_option = forms.CommandSwitchWindow.show(
+    ['None', 'HTL originator', 'Zone', 'Both'],
+    message='Include the HTL originator code and/or the Zone code in the workset names?'
+)
+if not name_option:
+    script.exit()
+add_originator = name_option in ('HTL originator', 'Both')
+add_zone = name_option in ('Zone', 'Both')
+# zone should not be used if "ZZ" or the same as the file name.
+# The model file name never changes, so the zone is extracted once here.
+file_name = doc.Title
+# Extract the third part from the file name
+groups = file_zone_pattern.match(file_name)
+file_zone = ''
+if groups:
+    file_zone = groups.group(1)
+# Current model file name should be considered in naming new worksets, so it is
+# sorted together with the link names. Sorting once lets the per-link
+# similar-name scan use a binary search instead of an O(N^2) pass.
+sorted_link_names = sorted(all_rvt_link_names + [file_name])
+# Both the output window and the workset table are the same for every link
+output = script.get_output()
+ws_table = doc.GetWorksetTable()
+# Only Z-Linked worksets can match a new workset name. Keeping their names
+# sorted allows a binary search instead of scanning every workset per link.
+linked_workset_names = []
+if not enable_worksharing:
+    linked_workset_names = sorted(
+        name for name in workset_dict if name.startswith(linked_file_prefix))
+# The first pass only decides what to do with each link; all workset
+# creation and parameter writes are collected here and applied in a single
+# transaction afterwards, so Revit regenerates once instead of per link.
+link_actions = []
+planned_workset_names = set()
+# Instances of the same linked file share one type - resolve it once
+link_type_cache = {}
+for count, (link, link_name, link_type_id) in enumerate(link_records, 1):
+    # Each print_md call re-parses Markdown and posts to the output window,
+    # so the per-link lines are buffered and written once at the end.
+    lines = []
+    # The table call is only a fallback for ids outside the user workset map
+    link_workset = (workset_by_id.get(link.WorksetId.IntegerValue)
+                    or ws_table.GetWorkset(link.WorksetId))
+    type_key = link_type_id.IntegerValue
+    link_type = link_type_cache.get(type_key)
+    if link_type is None:
+        link_type = doc.GetElement(link_type_id)
+        link_type_cache[type_key] = link_type
+    link_type_workset = (workset_by_id.get(link_type.WorksetId.IntegerValue)
+                         or ws_table.GetWorkset(link_type.WorksetId))
+
     link_workset_name = link_workset.Name
     type_workset_name = link_type_workset.Name
-    output = script.get_output()
-    output.print_md( '**'+str(count)+'. Link: ' + link_name +'**' )
-    output.print_md( '> Link Workset: ' + link_workset_name  )
-    output.print_md( '> Link Type Workset: ' + type_workset_name  )
+    lines.append( '**'+str(count)+'. Link: ' + link_name +'**' )
+    lines.append( '> Link Workset: ' + link_workset_name  )
+    lines.append( '> Link Type Workset: ' + type_workset_name  )
 
     # Extract parts from the file name
-    # i.e. GSK-HTL-RE-ZZ-M3-A-0001.rvt
-    match = re.match(r"(\w+)-(\w+)-(\w+)-(\w+)-(\w+)-(\w+)-(\d+)([\w\d\s]*)?", link_name)
-    # re.match: This function searches for a match at the beginning of the string (file_name). It returns a match object if the pattern is found, or None if no match is found.
-    # (\w+): This captures one or more word characters (letters, digits, or underscores). The parentheses indicate a capturing group.
-    # -: This matches the hyphen character literally.
-    # (\d+): This captures one or more digits.
-    #  The pattern consists of six groups, each separated by hyphens. These groups correspond to the different parts of the file name you want to extract.
-    # Group 1: First part (e.g., "GSK")
-    # Group 2: Second part - Originator (e.g., "HTL")
-    # Group 3: Third part - Zone (e.g., "RE")
-    # Group 4: Fourth part (e.g., "ZZ")
-    # Group 5: Fifth part (e.g., "M3")
-    # Group 6: Sixth part - Discipline (e.g., "A")
-    # Group 7: Digits (e.g., "0001")
-    # Group 8: Optional underscore, dash or space (e.g., "-_ ") followed by some text
+    # i.e. GSK-HTL-RE-ZZ-M3-A-0001.rvt - see parse_link_name for the format
+    parsed = parse_link_name(link_name)
 
-    if match:
-        groups = list(match.groups())
-        # Ensure the description is present
-        if len(groups) < 8:
-            groups.append("")
-        _, originator, zone, _, _, discipline, digits, description = groups
-        description = description if description is not None else ""
-        output.print_md("> Originator: " + originator + " Zone: " +zone+ " Discipline: " + discipline+ " Digits: "+ digits + " Description: " + description)
-        # match.groups(): This method returns a tuple containing all the captured groups from the regular expression match. In our case, it corresponds to the seven groups defined in the pattern.
-        # _: This is a placeholder variable. It is used to ignore specific groups.
+    if parsed:
+        originator, zone, discipline, digits, description = parsed
+        lines.append("> Originator: " + originator + " Zone: " +zone+ " Discipline: " + discipline+ " Digits: "+ digits + " Description: " + description)
         # Add originator to the workset name
-        if discipline == 'A' and not add_originator:
-            originator = ''
-        else:
-            originator = '-' + originator
-        # zone should not be used if "ZZ" or the same as the file name.
-        file_name = doc.Title
-        # Extract the third part from the file name
-        groups = re.match(r"(\w+)-(\w+)-(\w+)", file_name)
-        file_zone = ''
-        if groups:
-            file_zone = groups.group(3)
+        originator = '' if discipline == 'A' and not add_originator else '-' + originator
         if zone == 'ZZ' or not add_zone:
             zone = ''
-            output.print_md( '> Zone is ZZ or not requested. Skipping: ' + file_zone  )
+            lines.append( '> Zone is ZZ or not requested. Skipping: ' + file_zone  )
         else:
             zone = '-' + zone
         instance_name = discipline + originator + zone
         
-        similar_link_names = []
         if description:
-            output.print_md( '> Description from the end removed: ' + description  )
-            base_name = link_name.replace(description, "").strip()
-            base_name = base_name.replace(digits, "").strip()
-        else:
-            base_name = link_name.replace(digits, "").strip()
-        output.print_md( '> Base name: ' + base_name  )
+            lines.append( '> Description from the end removed: ' + description  )
+        base_name = base_name_of(link_name)
+        lines.append( '> Base name: ' + base_name  )
         # Check how many links have the same base name. We removed last characters which usually are digits from 0001.
         # There  will be always one the same as the link name in the loop.
-        rvt_link_names_except_link = [s for s in all_rvt_link_names if s != link_name]
-        # Current model file name should be considered in naming new worksets. We add it to the list of link names.
-        rvt_link_names_except_link.append(file_name)
-        rvt_link_names_with_file_name = rvt_link_names_except_link
-        for n in rvt_link_names_with_file_name:
-            if n.startswith(base_name):
-                similar_link_names.append(n)
-
-        def find_similar_part_names(desc, part_number, base_name, last_digit, similar_link_names):
-                if int(last_digit) > 1: # then we need to add number to the end anyway
-                    if desc != "":
-                        desc = desc + " " + last_digit
-                    else:
-                        desc = last_digit
-                else: # if 1 at the end we need to find if there are more
-                # find if there are two or more Internal model files.
-                    similar_part_names = []
-                    for p in similar_link_names:
-                        if p.startswith(base_name + part_number):
-                            similar_part_names.append(p)
-                    if len(similar_part_names) > 0: # then there are many parts. We need to add additional number.
-                        if desc != "":
-                            desc = desc + " " + last_digit
-                        else:
-                            desc = last_digit
-                return desc
+        similar_link_names = [n for n in prefix_matches(sorted_link_names, base_name)
+                              if n != link_name]
         # this gets last digit from digits
         last_digit = digits[-1]
 
@@ -176,22 +239,22 @@ for link in revit_links:
         if len(similar_link_names) > 0:
             # only for more than 1 we need to add digits at the end.
             # It could be that teh file name is from the same model or two files are linked. In both situations we need to add digits at the end or description.
-            output.print_md( '> More than one link with the same base name. Adding digits or description at the end.'  )
+            lines.append( '> More than one link with the same base name. Adding digits or description at the end.'  )
             # find what model part is he link
             # if there are more than 2 or more or model doesn't end with 1 adds that number to the end.
             if digits.startswith("1") and discipline == "A": # like ...100001 then this is Internal model
-                output.print_md( '> Internal Model detected with digits starting with 1.'  )
+                lines.append( '> Internal Model detected with digits starting with 1.'  )
                 digits = find_similar_part_names("Internal", "1", base_name, last_digit, similar_link_names)
             elif digits.startswith("2") and discipline == "A": # like ...200001 then this is Internal model
-                output.print_md( '> Facade Model detected with digits starting with 2.'  )
+                lines.append( '> Facade Model detected with digits starting with 2.'  )
                 digits = find_similar_part_names("Facade", "2", base_name, last_digit, similar_link_names)
             else:
-                output.print_md( '> Model with 0 or +3'  )
+                lines.append( '> Model with 0 or +3'  )
                 digits = find_similar_part_names("", digits[1], base_name, last_digit, similar_link_names)
             instance_name = instance_name + '-' + digits
         else:
             # if there are no other links with the base name and the model file name is not the same it may still be the Internal or the Facade model
-            output.print_md('> This link has unique base name.')
+            lines.append('> This link has unique base name.')
             if digits.startswith("1"): # like ...100001 then this is Internal model
                 digits = find_similar_part_names("Internal", "1", base_name, last_digit, similar_link_names)
                 instance_name = instance_name + '-' + digits
@@ -206,90 +269,107 @@ for link in revit_links:
                     instance_name = instance_name
         workset_name = linked_file_prefix + instance_name
     else:
-        output.print_md( '> Link name does not match the naming standard. Adding whole name to workset name.'  )
+        lines.append( '> Link name does not match the naming standard. Adding whole name to workset name.'  )
         workset_name = linked_file_prefix + link_name
         instance_name = link_name
-    output.print_md( '> New Workset name: ' + workset_name  )
+    lines.append( '> New Workset name: ' + workset_name  )
     # Now we need to check if a workset with this name already exists for this link
     existing_workset = [] # with this link name
     if not enable_worksharing:
-        for name in workset_dict.keys():
-            # Link workset name must start with "Z-Linked RVT-X-XXX-XX-000X"
-            if name.startswith(workset_name):
-                output.print_md( "> Workset with this base name exists and should be used: "+workset_name )
-                existing_workset.append(name)
+        # Link workset name must start with "Z-Linked RVT-X-XXX-XX-000X".
+        # bisect jumps to the first candidate; the walk stops at the first
+        # name that no longer shares the prefix.
+        i = bisect.bisect_left(linked_workset_names, workset_name)
+        while i < len(linked_workset_names) and linked_workset_names[i].startswith(workset_name):
+            lines.append( "> Workset with this base name exists and should be used: "+workset_name )
+            existing_workset.append(linked_workset_names[i])
+            i += 1
     if len(existing_workset) == 0:
-        # Workset needs to be created
-        with revit.Transaction('Create Workset for linked model'):
-            try:
-                newWs = DB.Workset.Create(revit.doc, workset_name)
-                worksetParam = \
-                    link.Parameter[DB.BuiltInParameter.ELEM_PARTITION_PARAM]
-                worksetParam.Set(newWs.Id.IntegerValue)
-                worksetTypeParam = \
-                    link_type.Parameter[DB.BuiltInParameter.ELEM_PARTITION_PARAM]
-                worksetTypeParam.Set(newWs.Id.IntegerValue)
-                # Sets link Name and MArk to make it the same as the link (this helps identify  the original link if it's duplicated)
-                worksetName = \
-                    link.Parameter[DB.BuiltInParameter.RVT_LINK_INSTANCE_NAME]
-                worksetName.Set(instance_name)
-                worksetMark = \
-                    link.Parameter[DB.BuiltInParameter.ALL_MODEL_MARK]
-                worksetMark.Set(instance_name)
-                output.print_md( '> New Workset created'  )
-                new_workset_names.append(workset_name)
-            except Exception as e:
-                print('Workset: {} already exists\nError: {}'.format(workset_name,e))
-    elif len(existing_workset) >= 1:
+        # Workset needs to be created. A second instance of the same file
+        # resolves to the same planned workset instead of a duplicate create.
+        if workset_name in planned_workset_names:
+            lines.append( '> Workset already planned for an earlier link and will be reused.' )
+        else:
+            planned_workset_names.add(workset_name)
+            # Keeps the sorted name list coherent, so later links resolve
+            # worksets planned in this run through the same prefix search.
+            bisect.insort(linked_workset_names, workset_name)
+        link_actions.append(
+            ('create', link, link_type, workset_name, instance_name, True, True))
+    else:
         # Workset/s already exists. For more than one first will be used.
-        output.print_md( "> RVT link Type or instance Workset will be corrected if incorrect.")
-        Ws = workset_dict[existing_workset[0]]
-        if not existing_workset[0].startswith(link_workset_name):
-            with revit.Transaction('Set correct Workset for linked model instance'):
+        lines.append( "> RVT link Type or instance Workset will be corrected if incorrect.")
+        link_actions.append(
+            ('reuse', link, link_type, existing_workset[0], instance_name,
+             not existing_workset[0].startswith(link_workset_name),
+             not existing_workset[0].startswith(type_workset_name)))
+        used_workset_names.add(existing_workset[0])
+    output.print_md('\n\n'.join(lines))
+
+if link_actions:
+    # swallow_errors installs pyRevit's failure preprocessor, which clears
+    # warnings silently instead of popping a modal dialog per warning
+    # during the batched commit.
+    with revit.Transaction('Configure RVT Link Worksets', swallow_errors=True):
+        # All missing worksets are created first so every link - including a
+        # second instance of the same file - can resolve its workset id by name.
+        created_ws_ids = {}
+        for action, link, link_type, workset_name, instance_name, _, _ in link_actions:
+            if action == 'create' and workset_name not in created_ws_ids:
                 try:
-                    worksetParam = \
-                        link.Parameter[DB.BuiltInParameter.ELEM_PARTITION_PARAM]
-                        # DB.BuiltInParameter.ELEM_PARTITION_PARAM is Workset
-                    worksetParam.Set(Ws.Id.IntegerValue)
+                    newWs = DB.Workset.Create(doc, workset_name)
+                    created_ws_ids[workset_name] = newWs.Id.IntegerValue
+                    new_workset_names.add(workset_name)
+                    output.print_md( '> New Workset created: ' + workset_name )
+                except Exception as e:
+                    print('Workset: {} already exists\nError: {}'.format(workset_name,e))
+        for action, link, link_type, workset_name, instance_name, fix_instance, fix_type in link_actions:
+            if action == 'create':
+                ws_id_int = created_ws_ids.get(workset_name)
+                if ws_id_int is None:
+                    # Creation failed above - nothing to assign the link to
+                    continue
+            else:
+                # The workset may also be one planned and created in this run
+                ws = workset_dict.get(workset_name)
+                ws_id_int = (ws.Id.IntegerValue if ws is not None
+                             else created_ws_ids.get(workset_name))
+                if ws_id_int is None:
+                    continue
+            if fix_instance:
+                try:
+                    link.Parameter[PARTITION_PARAM].Set(ws_id_int)
                     # Sets link Name and MArk to make it the same as the link (this helps identify  the original link if it's duplicated)
-                    worksetName = \
-                        link.Parameter[DB.BuiltInParameter.RVT_LINK_INSTANCE_NAME]
-                    worksetName.Set(instance_name)
-                    worksetMark = \
-                        link.Parameter[DB.BuiltInParameter.ALL_MODEL_MARK]
-                    worksetMark.Set(instance_name)
-                    output.print_md( "> RVT link instance Workset was corrected.")
+                    link.Parameter[LINK_NAME_PARAM].Set(instance_name)
+                    link.Parameter[MARK_PARAM].Set(instance_name)
                 except Exception as e:
                     print('Workset: {} could not be set to RVT link\nError: {}'.format(workset_name,e))
-        if not existing_workset[0].startswith(type_workset_name):
-            with revit.Transaction('Set correct Workset for linked model Type'):
+            if fix_type:
                 try:
-                    worksetTypeParam = \
-                        link_type.Parameter[DB.BuiltInParameter.ELEM_PARTITION_PARAM]
-                    worksetTypeParam.Set(Ws.Id.IntegerValue)
-                    output.print_md( "> RVT link Type Workset was corrected.")
+                    link_type.Parameter[PARTITION_PARAM].Set(ws_id_int)
                 except Exception as e:
                     print('Workset: {} could not be set to RVT link type\nError: {}'.format(workset_name,e))
-        used_workset_names.append(existing_workset[0])
-    else:
-        # More than one workset with this new workset name beginning exists
-        # First one will be used
-        pass
 
 unused_workset_names = []
 if not enable_worksharing:
-    for ws_name, ws in workset_dict.items():
-        if ws_name.startswith('Z-Linked RVT') or ws_name.startswith('Z-Linked-RVT'):
-            if ws_name not in used_workset_names and ws_name not in new_workset_names:
-                unused_workset_names.append(ws_name)
+    # startswith with a tuple checks both prefixes in one call, and the
+    # union of used and new names makes each membership test a hash lookup
+    linked_prefixes = ('Z-Linked RVT', 'Z-Linked-RVT')
+    known_workset_names = used_workset_names | new_workset_names
+    unused_workset_names = [ws_name for ws_name in workset_dict
+                            if ws_name.startswith(linked_prefixes)
+                            and ws_name not in known_workset_names]
  
 if unused_workset_names:
     app = __revit__.Application
     ver = int(app.VersionNumber)
-    unused_workset_names = ',\n'.join(unused_workset_names)
+    # Set for the membership test below - the joined display string would
+    # also match names that are substrings of other workset names.
+    unused_set = set(unused_workset_names)
+    unused_display = ',\n'.join(unused_workset_names)
     if ver >=2023:
         delete_empty_link_worksets = forms.alert(
-                'Delete empty Z-Linked... Worksets?\n'+unused_workset_names+'\n\n(Elements from these Worksets will be moved to a default Workset.)', 
+                'Delete empty Z-Linked... Worksets?\n'+unused_display+'\n\n(Elements from these Worksets will be moved to a default Workset.)',
                 title="Enable Worksharing?",
                 cancel=True,
                 ok = False,
@@ -300,13 +380,11 @@ if unused_workset_names:
             deleted_worksets = []
             not_editable_worksets = []
             for ws in workset_dict.values():
-                if ws.IsDefaultWorkset:
-                    workset_id = ws.Id
-                if ws.Name in unused_workset_names:
+                if ws.Name in unused_set:
                     delete_worksets.append(ws)
             if delete_worksets:
                 # Create DeleteWorksetSettings with DeleteWorksetOption.MoveElementsToWorkset not DeleteElements
-                delete_settings = DB.DeleteWorksetSettings(DB.DeleteWorksetOption.MoveElementsToWorkset, workset_id)
+                delete_settings = DB.DeleteWorksetSettings(DB.DeleteWorksetOption.MoveElementsToWorkset, default_workset_id)
                 with revit.Transaction('Delete Unused Worksets'):
                     for ws in delete_worksets:
                         if ws.IsEditable:
@@ -318,17 +396,12 @@ if unused_workset_names:
                                 print('Workset: {} could not be deleted\nError: {}'.format(ws.Name,e))
                         else:
                             not_editable_worksets.append(ws.Name)
+                    summary_parts = []
                     if deleted_worksets:
-                        deleted = 'Deleted Workset:\n'+',\n'.join(deleted_worksets)
-                        if not_editable_worksets:
-                            deleted += '\n\n'
-                    else:
-                        deleted = ''
+                        summary_parts.append('Deleted Workset:\n'+',\n'.join(deleted_worksets))
                     if not_editable_worksets:
-                        not_deleted = 'Make these worksets Editable and run the script again or delete manually:\n'+',\n'.join(not_editable_worksets)+'\n\n(It is not possible to delete Worksets using API id they are not Editable)'
-                    else:
-                        not_deleted = ''
-                    if deleted or not_deleted:
-                        forms.alert('{}{}'.format(deleted,not_deleted))
+                        summary_parts.append('Make these worksets Editable and run the script again or delete manually:\n'+',\n'.join(not_editable_worksets)+'\n\n(It is not possible to delete Worksets using API id they are not Editable)')
+                    if summary_parts:
+                        forms.alert('\n\n'.join(summary_parts))
     else:
-        forms.alert('It is not possible to delete Worksets using API in Revit 2022 and earlier.\n\nDelete following Worksets manually:\n{}'.format(unused_workset_names)) 
+        forms.alert('It is not possible to delete Worksets using API in Revit 2022 and earlier.\n\nDelete following Worksets manually:\n{}'.format(unused_display))
@@ -17,10 +17,10 @@ doc = revit.doc
 
 def get_file_size(file_path):
     try:
-        size_bytes = os.path.getsize(file_path)
-        size_kb = size_bytes / 1024.0
-        size_mb = size_kb / 1024.0
-        return "{:.2f} MB".format(size_mb)
+        # One stat call - getsize stats the file anyway, and for Revit
+        # Server or cloud paths every extra stat is a network round trip
+        st = os.stat(file_path)
+        return "{:.2f} MB".format(st.st_size / (1024.0 * 1024.0))
     except OSError as error:
         return "Error: " + str(error)
 output = ""
@@ -199,13 +199,17 @@ else:
                 else:
                     create3DViewsForEachWorkset()
 
-            for workset in worksets_collection:
+            # Each view matches exactly one workset by name, so the view is
+            # resolved through one dictionary lookup per workset instead of
+            # comparing every workset/view name pair.
+            viewsByName = {v.Name: v for v in allViews}
+            for workset in worksets:
+                worksetId = workset.Id
+                worksetView = viewsByName.get(workset.Name)
                 try:
                     for v in allViews:
-                        if workset.Name == v.Name:
-                            v.SetWorksetVisibility( workset.Id, visible )
-                        else:
-                            v.SetWorksetVisibility( workset.Id, hidden )
+                        v.SetWorksetVisibility(
+                            worksetId, visible if v is worksetView else hidden)
                 except Exception as del_err:
                     logger = script.get_logger()
                     logger.error('Error applying workset visibility: {} | {}'
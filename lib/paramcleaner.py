@@ -0,0 +1,262 @@
+# Shared engine for the Project and Shared Parameters Cleaner buttons.
+# Both buttons follow the same flow: list the bound parameters, let the user
+# pick which to check, test whether any element carries a real value and offer
+# to delete the unused ones. They only differ in which ParameterElement type
+# they target, so everything else lives here in one place.
+
+from pyrevit import revit, DB, script, forms
+from System.Collections.Generic import List
+
+logger = script.get_logger()
+
+# Bound once - the per-element usage check compares against these constantly
+STORAGE_STRING = DB.StorageType.String
+STORAGE_INTEGER = DB.StorageType.Integer
+STORAGE_DOUBLE = DB.StorageType.Double
+STORAGE_ELEMENT_ID = DB.StorageType.ElementId
+
+
+class ParamItem(forms.TemplateListItem):
+    def __init__(self, name, definition, category_set, param_id, is_inst):
+        self.Name = name
+        self.definition = definition
+        self.category_set = category_set
+        self.param_id = param_id
+        self.is_inst_value = is_inst
+        self.inUse = False
+        # Resolved once from the first element carrying the parameter
+        self.storage_type = None
+        self.is_yesno = False
+
+
+class ParamToCheck(forms.TemplateListItem):
+    @property
+    def name(self):
+        return self.item.Name
+
+
+class ParamWithUsage(forms.TemplateListItem):
+    @property
+    def name(self):
+        if self.item[1]:
+            return "{} - In use".format(self.item[0].Name)
+        return "{} - Not used".format(self.item[0].Name)
+
+
+def classify_parameter(par, item, ver):
+    # The storage type and the YesNo check are fixed per parameter, so they
+    # are resolved once instead of being re-evaluated for every element.
+    item.storage_type = par.StorageType
+    if item.storage_type == STORAGE_INTEGER:
+        if ver >= 2023: # ParameterType() got obsolete in Revit 2023 and above.
+            item.is_yesno = par.Definition.GetDataType().Equals(DB.SpecTypeId.Boolean.YesNo)
+        else:
+            item.is_yesno = DB.ParameterType.YesNo == par.Definition.ParameterType
+
+
+def parameter_in_use(par, item, ver):
+    # Truthiness check for a single parameter instance, shared by the
+    # per-element path and the bulk (Revit 2024+) path.
+    if item.storage_type is None:
+        classify_parameter(par, item, ver)
+    if not par.HasValue:
+        return False
+    if item.is_yesno:
+        # A YesNo parameter counts as used as soon as it has a value.
+        return True
+    value = None
+    storage_type = item.storage_type
+    try:
+        if storage_type == STORAGE_STRING:
+            value = par.AsString()
+        elif storage_type == STORAGE_INTEGER:
+            value = par.AsInteger()
+        elif storage_type == STORAGE_DOUBLE:
+            value = par.AsDouble()
+        elif storage_type == STORAGE_ELEMENT_ID:
+            value = par.AsElementId()
+        # If parameter has values of empty sting = "" it should be deleted.
+        # par.HasValue for empty string would return True - has a value. We do not want this except YesNo parameters.
+        if value or value == 0:
+            return True
+    except Exception as del_err:
+        logger.error('Error checking parameter value: {} | {}'
+                .format(item.Name, del_err))
+        return True # For safety it is better to not delete a parameter that created an error and assume it has a value and has been used.
+    return False
+
+
+def check_if_in_use(elements, item, ver):
+    # If there are no elements a parameter can be deleted.
+    # any() short-circuits at the first element using the parameter; the
+    # definition and the check are bound to locals to keep the per-element
+    # work minimal. get_Parameter(Definition) returns exactly the bound
+    # parameter, unlike GetParameters(name) which allocates a list to filter.
+    if not elements:
+        return False
+    definition = item.definition
+    in_use = parameter_in_use
+    return any(in_use(par, item, ver)
+               for par in (element.get_Parameter(definition)
+                           for element in elements)
+               if par is not None)
+
+
+def elements_by_categories(doc, cat_ids, is_inst):
+    # One indexed collector traversal over all categories of a parameter
+    # using an ElementMulticategoryFilter instead of one pass per category.
+    cat_filter = DB.ElementMulticategoryFilter(List[DB.ElementId](cat_ids))
+    collector = DB.FilteredElementCollector(doc).WherePasses(cat_filter)
+    if is_inst:
+        collector = collector.WhereElementIsNotElementType()
+    else:
+        collector = collector.WhereElementIsElementType()
+    return collector.ToElements()
+
+
+def list_bound_parameters(doc, param_class, is_target_param=None):
+    # A typed collector returns only the parameter elements of interest in one
+    # pass instead of walking every binding map entry and filtering by type.
+    # Parameters without a binding (e.g. global parameters) are skipped.
+    items = []
+    binding_map = doc.ParameterBindings
+    for param_elem in DB.FilteredElementCollector(doc).OfClass(param_class):
+        if is_target_param is not None and not is_target_param(param_elem):
+            continue
+        definition = param_elem.GetDefinition()
+        binding = binding_map.Item[definition]
+        if binding is None:
+            continue
+        items.append(ParamItem(definition.Name, definition,
+                               binding.Categories, param_elem.Id,
+                               isinstance(binding, DB.InstanceBinding)))
+    # Sorts a list of parameters alphabetically by name.
+    items.sort(key=lambda item: item.Name)
+    return items
+
+
+def find_parameters_in_use(doc, ver, selected):
+    # Caches collector results across all parameters, keyed by the set of
+    # category ids and the binding kind, so parameters sharing the same
+    # binding reuse one traversal.
+    element_cache = {}
+
+    def collect_elements(item):
+        cat_ids = [cat.Id for cat in item.category_set]
+        key = (frozenset(cat_id.IntegerValue for cat_id in cat_ids),
+               item.is_inst_value)
+        elements = element_cache.get(key)
+        if elements is None:
+            elements = tuple(elements_by_categories(doc, cat_ids,
+                                                    item.is_inst_value))
+            element_cache[key] = elements
+        return elements
+
+    # Parameters bound to no categories cannot be in use,
+    # so no elements need to be collected for them.
+    to_check = [item for item in selected
+                if item.category_set and not item.category_set.IsEmpty]
+
+    if ver >= 2024:
+        # Revit 2024+ exposes Element.EvaluateAllParameterValues which
+        # returns every parameter of an element in one managed call.
+        # Iterating elements once per binding and testing all still
+        # pending parameters against each element turns one interop
+        # round trip per (element, parameter) pair into one per element.
+        params_by_key = {}
+        for item in to_check:
+            key = (frozenset(cat.Id.IntegerValue for cat in item.category_set),
+                   item.is_inst_value)
+            params_by_key.setdefault(key, []).append(item)
+        for items in params_by_key.values():
+            pending = {item.param_id.IntegerValue: item for item in items}
+            for element in collect_elements(items[0]):
+                for par in element.EvaluateAllParameterValues():
+                    item = pending.get(par.Id.IntegerValue)
+                    if item is not None and parameter_in_use(par, item, ver):
+                        item.inUse = True
+                        del pending[par.Id.IntegerValue]
+                if not pending:
+                    break
+    else:
+        for item in to_check:
+            # check_if_in_use still stops at the first element using the parameter
+            if check_if_in_use(collect_elements(item), item, ver):
+                item.inUse = True
+
+    parameters_with_usage = [(item, item.inUse) for item in selected]
+    # Sort the list so unused parameters come first
+    parameters_with_usage.sort(key=lambda x: x[1])
+    return parameters_with_usage
+
+
+def delete_parameters(doc, kind, selected):
+    deleted = []
+    ids = List[DB.ElementId]([item.param_id for item in selected])
+    with revit.Transaction('Purge Unused {} Parameters'.format(kind)):
+        try:
+            # One Delete call for all ids lets Revit remove
+            # everything in a single pass instead of per-id calls.
+            doc.Delete(ids)
+            deleted = [item.Name for item in selected]
+        except Exception:
+            # Falls back to per-parameter deletes so one bad id
+            # does not abort the whole purge.
+            for item in selected:
+                try:
+                    doc.Delete(item.param_id)
+                    deleted.append(item.Name)
+                except Exception as del_err:
+                    logger.error('Error purging parameter: {} | {}'
+                                 .format(item.Name, del_err))
+    if len(deleted) > 1:
+        forms.alert("Parameters: {} were deleted from the model.".format(', '.join(deleted)))
+    elif deleted:
+        forms.alert('Parameter "{}" was deleted from the model.'.format(deleted[0]))
+
+
+def run_cleaner(kind, param_class, is_target_param=None):
+    # Full UI flow shared by both Cleaner buttons. kind is 'Project' or
+    # 'Shared'; param_class is the ParameterElement type to collect and the
+    # optional is_target_param predicate filters it further.
+    doc = revit.doc
+    ver = int(doc.Application.VersionNumber)
+
+    if doc.IsFamilyDocument:
+        forms.alert('This is a family document. Please open a project document.')
+        return
+
+    items = list_bound_parameters(doc, param_class, is_target_param)
+    if not items:
+        forms.alert('No {} Parameters in the model.'.format(kind))
+        return
+
+    # Ask user to select parameters to check
+    return_options = \
+        forms.SelectFromList.show(
+            [ParamToCheck(x) for x in items],
+            title='Select {} Parameters to check if they are in use.'.format(kind),
+            width=500,
+            button_name='Select these parameters',
+            multiselect=True
+        )
+    if not return_options:
+        forms.alert('Nothing selected.')
+        return
+
+    parameters_with_usage = find_parameters_in_use(doc, ver, return_options)
+
+    # Ask user to select parameters to delete.
+    delete_options = \
+        forms.SelectFromList.show(
+            [ParamWithUsage(x) for x in parameters_with_usage],
+            title='Parameters sorted by usage. Select which to delete.',
+            width=500,
+            button_name='Delete parameters!',
+            multiselect=True
+        )
+    if not delete_options:
+        forms.alert('Nothing selected.')
+        return
+
+    delete_parameters(doc, kind, [item_tuple[0] for item_tuple in delete_options])
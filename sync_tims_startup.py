@@ -28,9 +28,8 @@ if not os.path.exists(base_csv_directory):
     os.makedirs(base_csv_directory)
 
 def get_size_MB(file_path):
-        size_bytes = os.path.getsize(file_path)
-        size_kb = size_bytes / 1024.0 # With no .0 integer is returned
-        size_mb = size_kb / 1024.0
+        # One stat call - getsize stats the file anyway. With no .0 an integer is returned
+        size_mb = os.stat(file_path).st_size / (1024.0 * 1024.0)
         # MessageBox.Show("{:.2f} MB".format(size_mb), "pyRevit Hook", 0)
         return "{:.2f}".format(size_mb) # Size in MB
 